@@ -415,6 +415,10 @@ WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_CONCURRENT_REQUESTS = int(
 ALLOW_CUSTOM_PYTHON_EXECUTION_IN_WORKFLOWS = str2bool(
     os.getenv("ALLOW_CUSTOM_PYTHON_EXECUTION_IN_WORKFLOWS", True)
 )
+# JIT kernels are compiled in HTTP app startup handler - it does not run when
+# lifespan events are disabled (as in docker/config/lambda.py), so the flag has
+# no effect there and annotators keep using numpy code paths
+INFERENCE_WARM_JIT = str2bool(os.getenv("INFERENCE_WARM_JIT", "False"))
 
 MODEL_VALIDATION_DISABLED = str2bool(os.getenv("MODEL_VALIDATION_DISABLED", "False"))
 
@@ -1,6 +1,9 @@
 # TODO - for everyone: start migrating other handlers to bring relief to http_api.py
+from functools import lru_cache
 from typing import Dict, List, Optional, Set, Union
 
+import orjson
+from fastapi.responses import Response
 from packaging.specifiers import SpecifierSet
 
 from inference.core.entities.responses.workflows import (
@@ -41,13 +44,87 @@ from inference.core.workflows.execution_engine.v1.introspection.types_discovery
     discover_kinds_typing_hints,
 )
 
+_DYNAMIC_BLOCK_DEFINITION_SCHEMA = DynamicBlockDefinition.schema()
+
 
 def handle_describe_workflows_blocks_request(
     dynamic_blocks_definitions: Optional[List[DynamicBlockDefinition]] = None,
     requested_execution_engine_version: Optional[str] = None,
 ) -> WorkflowsBlocksDescription:
+    """
+    Builds description of workflows blocks on each call. Description shares nested
+    parts (Universal Query Language description, dynamic block definition schema)
+    with other descriptions, so it must not be mutated. HTTP API serves cached,
+    pre-serialised description instead - see
+    `handle_describe_workflows_blocks_request_raw(...)`.
+    """
     if dynamic_blocks_definitions is None:
         dynamic_blocks_definitions = []
+    return _describe_workflows_blocks(
+        dynamic_blocks_definitions=[
+            definition.model_dump(mode="json")
+            for definition in dynamic_blocks_definitions
+        ],
+        requested_execution_engine_version=requested_execution_engine_version,
+    )
+
+
+def handle_describe_workflows_blocks_request_raw(
+    dynamic_blocks_definitions: Optional[List[DynamicBlockDefinition]] = None,
+    requested_execution_engine_version: Optional[str] = None,
+) -> Response:
+    if not dynamic_blocks_definitions:
+        content = _serialise_no_dynamic_blocks_description(
+            requested_execution_engine_version=requested_execution_engine_version,
+        )
+    else:
+        serialised_definitions = orjson.dumps(
+            [
+                definition.model_dump(mode="json")
+                for definition in dynamic_blocks_definitions
+            ],
+            option=orjson.OPT_SORT_KEYS,
+        )
+        content = _serialise_dynamic_blocks_description(
+            serialised_definitions=serialised_definitions,
+            requested_execution_engine_version=requested_execution_engine_version,
+        )
+    return Response(content=content, media_type="application/json")
+
+
+@lru_cache(maxsize=8)
+def _serialise_no_dynamic_blocks_description(
+    requested_execution_engine_version: Optional[str],
+) -> bytes:
+    description = _describe_workflows_blocks(
+        dynamic_blocks_definitions=[],
+        requested_execution_engine_version=requested_execution_engine_version,
+    )
+    return _serialise_blocks_description(description=description)
+
+
+# each entry holds few MB of serialised description and keys come from clients
+# payloads - cache is kept small not to pin lots of memory in server
+@lru_cache(maxsize=4)
+def _serialise_dynamic_blocks_description(
+    serialised_definitions: bytes,
+    requested_execution_engine_version: Optional[str],
+) -> bytes:
+    description = _describe_workflows_blocks(
+        dynamic_blocks_definitions=orjson.loads(serialised_definitions),
+        requested_execution_engine_version=requested_execution_engine_version,
+    )
+    return _serialise_blocks_description(description=description)
+
+
+def _serialise_blocks_description(description: WorkflowsBlocksDescription) -> bytes:
+    return orjson.dumps(description.model_dump(mode="json"))
+
+
+def _describe_workflows_blocks(
+    dynamic_blocks_definitions: List[dict],
+    requested_execution_engine_version: Optional[str],
+) -> WorkflowsBlocksDescription:
     dynamic_blocks = compile_dynamic_blocks(
         dynamic_blocks_definitions=dynamic_blocks_definitions,
     )
@@ -81,21 +158,24 @@ def handle_describe_workflows_blocks_request(
         )
         for primitives_connection in blocks_connections.primitives_connections
     ]
-    uql_operations_descriptions = prepare_operations_descriptions()
-    uql_operators_descriptions = prepare_operators_descriptions()
-    universal_query_language_description = (
-        UniversalQueryLanguageDescription.from_internal_entities(
-            operations_descriptions=uql_operations_descriptions,
-            operators_descriptions=uql_operators_descriptions,
-        )
-    )
+    universal_query_language_description = _describe_universal_query_language()
     return WorkflowsBlocksDescription(
         blocks=blocks_description.blocks,
         declared_kinds=blocks_description.declared_kinds,
         kinds_connections=kinds_connections,
         primitives_connections=primitives_connections,
         universal_query_language_description=universal_query_language_description,
-        dynamic_block_definition_schema=DynamicBlockDefinition.schema(),
+        dynamic_block_definition_schema=_DYNAMIC_BLOCK_DEFINITION_SCHEMA,
+    )
+
+
+@lru_cache(maxsize=1)
+def _describe_universal_query_language() -> UniversalQueryLanguageDescription:
+    uql_operations_descriptions = prepare_operations_descriptions()
+    uql_operators_descriptions = prepare_operators_descriptions()
+    return UniversalQueryLanguageDescription.from_internal_entities(
+        operations_descriptions=uql_operations_descriptions,
+        operators_descriptions=uql_operators_descriptions,
     )
 
 
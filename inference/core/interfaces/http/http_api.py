@@ -116,6 +116,7 @@ from inference.core.env import (
     ENABLE_PROMETHEUS,
     ENABLE_STREAM_API,
     ENABLE_WORKFLOWS_PROFILING,
+    INFERENCE_WARM_JIT,
     LAMBDA,
     LEGACY_ROUTE_ENABLED,
     LMM_ENABLED,
@@ -155,7 +156,7 @@ from inference.core.exceptions import (
 )
 from inference.core.interfaces.base import BaseInterface
 from inference.core.interfaces.http.handlers.workflows import (
-    handle_describe_workflows_blocks_request,
+    handle_describe_workflows_blocks_request_raw,
     handle_describe_workflows_interface,
 )
 from inference.core.interfaces.http.middlewares.gzip import gzip_response_if_requested
@@ -509,6 +510,18 @@ class HttpInterface(BaseInterface):
             root_path=root_path,
         )
 
+        if INFERENCE_WARM_JIT:
+
+            @app.on_event("startup")
+            def warm_up_jit_kernels_on_startup() -> None:
+                # numba is imported and kernels are compiled only by the
+                # warm-up - until it runs, annotators use numpy code paths
+                from inference.core.workflows.core_steps.visualizations.common.annotators.jit import (
+                    warm_up_jit_kernels,
+                )
+
+                warm_up_jit_kernels()
+
         if ENABLE_PROMETHEUS:
             InferenceInstrumentator(
                 app, model_manager=model_manager, endpoint="/metrics"
@@ -1247,7 +1260,7 @@ class HttpInterface(BaseInterface):
             async def describe_workflows_blocks(
                 request: Request,
             ) -> Union[WorkflowsBlocksDescription, Response]:
-                result = handle_describe_workflows_blocks_request()
+                result = handle_describe_workflows_blocks_request_raw()
                 return gzip_response_if_requested(request=request, response=result)
 
             @app.post(
@@ -1275,7 +1288,7 @@ class HttpInterface(BaseInterface):
                     requested_execution_engine_version = (
                         request_payload.execution_engine_version
                     )
-                result = handle_describe_workflows_blocks_request(
+                result = handle_describe_workflows_blocks_request_raw(
                     dynamic_blocks_definitions=dynamic_blocks_definitions,
                     requested_execution_engine_version=requested_execution_engine_version,
                 )
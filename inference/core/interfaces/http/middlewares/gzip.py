@@ -9,13 +9,14 @@ T = TypeVar("T", bound=BaseModel)
 
 def gzip_response_if_requested(
     request: Request,
-    response: T,
+    response: Union[Response, T],
 ) -> Union[Response, T]:
     if "gzip" not in request.headers.get("Accept-Encoding", ""):
         return response
-    response = Response(
-        content=response.json(),
-    )
+    if not isinstance(response, Response):
+        response = Response(
+            content=response.json(),
+        )
     response.body = gzip.compress(response.body)
     response.headers["Content-Encoding"] = "gzip"
     response.headers["Content-Length"] = str(len(response.body))
@@ -0,0 +1,115 @@
+import importlib.util
+from threading import Lock
+from typing import Callable, Optional
+
+import numpy as np
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+# compiled kernel is only set by `warm_up_paint_masks_kernels()`, so that no
+# request ever waits for JIT compilation - until then numpy path is used
+_paint_masks_kernel: Optional[Callable[..., None]] = None
+_paint_masks_kernel_lock = Lock()
+
+
+def paint_masks(
+    image: np.ndarray, masks: np.ndarray, order: np.ndarray, colors: np.ndarray
+) -> None:
+    """
+    Paints `masks[i]` with `colors[i]` into `image` in place, visiting masks in
+    `order` - masks appearing later in `order` are painted on top of the earlier
+    ones. Each mask only touches the box it spans.
+
+    Uses JIT-compiled kernel once it was compiled by
+    `warm_up_paint_masks_kernels()`, falling back to numpy otherwise.
+    """
+    # masks given in other dtypes (like uint8) are not accepted by `np.copyto(...)`
+    # as `where` argument
+    masks = masks.astype(np.bool_, copy=False)
+    # restricting the writes to the boxes masks span keeps the traffic
+    # proportional to masks sizes rather than to the whole image
+    boxes = _find_masks_boxes(masks=masks)
+    kernel = _paint_masks_kernel
+    # other dtypes and layouts would trigger compilation of new kernel specialisation
+    if (
+        kernel is not None
+        and masks.dtype == np.bool_
+        and image.dtype == np.uint8
+        and image.flags.c_contiguous
+    ):
+        kernel(
+            image,
+            np.ascontiguousarray(masks),
+            np.ascontiguousarray(order, dtype=np.int64),
+            np.ascontiguousarray(colors, dtype=np.uint8),
+            boxes,
+        )
+        return None
+    for mask_idx in order:
+        top, bottom, left, right = boxes[mask_idx]
+        np.copyto(
+            image[top:bottom, left:right],
+            colors[mask_idx],
+            where=masks[mask_idx, top:bottom, left:right, np.newaxis],
+        )
+
+
+def _find_masks_boxes(masks: np.ndarray) -> np.ndarray:
+    # boxes are given as (top, bottom, left, right), empty masks get empty box
+    boxes = np.zeros((masks.shape[0], 4), dtype=np.int64)
+    masks_rows = masks.any(axis=2)
+    for mask_idx, mask_rows in enumerate(masks_rows):
+        rows = np.flatnonzero(mask_rows)
+        if rows.size == 0:
+            continue
+        top, bottom = rows[0], rows[-1] + 1
+        columns = np.flatnonzero(masks[mask_idx, top:bottom].any(axis=0))
+        boxes[mask_idx] = (top, bottom, columns[0], columns[-1] + 1)
+    return boxes
+
+
+def _paint_masks_rows(
+    image: np.ndarray,
+    masks: np.ndarray,
+    order: np.ndarray,
+    colors: np.ndarray,
+    boxes: np.ndarray,
+) -> None:
+    channels = image.shape[2]
+    for y in range(image.shape[0]):
+        for k in range(order.shape[0]):
+            mask_idx = order[k]
+            if y < boxes[mask_idx, 0] or y >= boxes[mask_idx, 1]:
+                continue
+            for x in range(boxes[mask_idx, 2], boxes[mask_idx, 3]):
+                if masks[mask_idx, y, x]:
+                    for c in range(channels):
+                        image[y, x, c] = colors[mask_idx, c]
+
+
+def warm_up_paint_masks_kernels() -> None:
+    """
+    Compiles JIT kernel for arguments `MaskAnnotator` passes and makes
+    `paint_masks(...)` use it from now on. No-op when `numba` is not installed.
+    """
+    global _paint_masks_kernel
+    if not NUMBA_AVAILABLE:
+        return None
+    with _paint_masks_kernel_lock:
+        if _paint_masks_kernel is not None:
+            return None
+        from numba import njit
+
+        # kernel is called concurrently from workflows executor threads, which
+        # numba parallel threading layers do not guarantee to handle safely
+        kernel = njit(_paint_masks_rows)
+        image = np.zeros((16, 16, 3), dtype=np.uint8)
+        masks = np.ones((1, 16, 16), dtype=np.bool_)
+        kernel(
+            image,
+            masks,
+            np.zeros((1,), dtype=np.int64),
+            np.zeros((1, 3), dtype=np.uint8),
+            _find_masks_boxes(masks=masks),
+        )
+        _paint_masks_kernel = kernel
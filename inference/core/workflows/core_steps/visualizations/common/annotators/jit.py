@@ -0,0 +1,11 @@
+from inference.core.workflows.core_steps.visualizations.common.annotators._mask_kernel import (
+    warm_up_paint_masks_kernels,
+)
+
+
+def warm_up_jit_kernels() -> None:
+    """
+    Compiles JIT kernels used by annotators upfront - to be called at worker
+    startup instead of letting the first request pay the compilation cost.
+    """
+    warm_up_paint_masks_kernels()
@@ -0,0 +1,134 @@
+from typing import Optional, Union
+
+import cv2
+import numpy as np
+from supervision import Color, Detections
+from supervision.annotators.base import BaseAnnotator
+from supervision.annotators.utils import ColorLookup
+from supervision.draw.color import ColorPalette
+
+from inference.core.workflows.core_steps.visualizations.common.annotators._mask_kernel import (
+    paint_masks,
+)
+
+
+class MaskAnnotator(BaseAnnotator):
+    """
+    A class for drawing masks on an image using provided detections - equivalent of
+    `sv.MaskAnnotator` which is able to produce annotated copy of the scene without
+    copying the scene upfront.
+
+    !!! warning
+
+        This annotator uses `sv.Detections.mask`.
+    """
+
+    def __init__(
+        self,
+        color: Union[Color, ColorPalette] = ColorPalette.DEFAULT,
+        opacity: float = 0.5,
+        color_lookup: ColorLookup = ColorLookup.CLASS,
+    ):
+        """
+        Args:
+            color (Union[Color, ColorPalette]): The color or color palette to use for
+                annotating detections.
+            opacity (float): Opacity of the overlay mask. Must be between `0` and `1`.
+            color_lookup (ColorLookup): Strategy for mapping colors to annotations.
+                Options are `INDEX`, `CLASS`, `TRACK`.
+        """
+        self.color: Union[Color, ColorPalette] = color
+        self.opacity = opacity
+        self.color_lookup: ColorLookup = color_lookup
+        self._color_lut = _build_color_lut(color=color)
+
+    def annotate(
+        self,
+        scene: np.ndarray,
+        detections: Detections,
+        custom_color_lookup: Optional[np.ndarray] = None,
+        copy_scene: bool = False,
+    ) -> np.ndarray:
+        """
+        Annotates the given scene with masks based on the provided detections.
+
+        Args:
+            scene (np.ndarray): The image where masks will be drawn.
+            detections (Detections): Object detections to annotate.
+            custom_color_lookup (Optional[np.ndarray]): Custom color lookup array.
+                Allows to override the default color mapping strategy.
+            copy_scene (bool): When set - `scene` is left untouched and annotations
+                are blended into the buffer holding colored masks, which is
+                returned. Otherwise, `scene` is annotated in place.
+
+        Returns:
+            The annotated image.
+        """
+        if detections.mask is None or len(detections) == 0:
+            return scene.copy() if copy_scene else scene
+        colors = self._resolve_colors(
+            detections=detections,
+            color_lookup=(
+                self.color_lookup
+                if custom_color_lookup is None
+                else custom_color_lookup
+            ),
+        )
+        colored_mask = scene.copy()
+        # smaller masks are painted last, to be drawn on top of larger ones
+        paint_masks(
+            image=colored_mask,
+            masks=detections.mask,
+            order=np.flip(np.argsort(detections.area)),
+            colors=colors,
+        )
+        destination = colored_mask if copy_scene else scene
+        cv2.addWeighted(
+            colored_mask, self.opacity, scene, 1 - self.opacity, 0, dst=destination
+        )
+        return destination
+
+    def _resolve_colors(
+        self,
+        detections: Detections,
+        color_lookup: Union[ColorLookup, np.ndarray],
+    ) -> np.ndarray:
+        if isinstance(self.color, Color):
+            return np.broadcast_to(self._color_lut, (len(detections), 3))
+        color_idx = _resolve_color_idx(detections=detections, color_lookup=color_lookup)
+        return self._color_lut[color_idx % len(self._color_lut)]
+
+
+def _build_color_lut(color: Union[Color, ColorPalette]) -> np.ndarray:
+    if isinstance(color, Color):
+        return np.asarray([color.as_bgr()], dtype=np.uint8)
+    return np.asarray([c.as_bgr() for c in color.colors], dtype=np.uint8)
+
+
+def _resolve_color_idx(
+    detections: Detections,
+    color_lookup: Union[ColorLookup, np.ndarray],
+) -> np.ndarray:
+    # vectorised counterpart of `sv.annotators.utils.resolve_color_idx(...)`
+    if isinstance(color_lookup, np.ndarray):
+        if len(color_lookup) != len(detections):
+            raise ValueError(
+                f"Length of color lookup {len(color_lookup)} "
+                f"does not match length of detections {len(detections)}"
+            )
+        return color_lookup.astype(np.int64)
+    if color_lookup == ColorLookup.INDEX:
+        return np.arange(len(detections))
+    if color_lookup == ColorLookup.CLASS:
+        if detections.class_id is None:
+            raise ValueError(
+                "Could not resolve color by class because "
+                "Detections do not have class_id"
+            )
+        return detections.class_id.astype(np.int64)
+    if detections.tracker_id is None:
+        raise ValueError(
+            "Could not resolve color by track because "
+            "Detections do not have tracker_id"
+        )
+    return detections.tracker_id.astype(np.int64)
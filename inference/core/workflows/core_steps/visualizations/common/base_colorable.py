@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Literal, Optional, Union
+from functools import lru_cache
+from typing import List, Literal, Optional, Tuple, Union
 
 import supervision as sv
 from pydantic import Field
@@ -115,37 +116,11 @@ class ColorableVisualizationManifest(PredictionsVisualizationManifest, ABC):
 class ColorableVisualizationBlock(PredictionsVisualizationBlock, ABC):
     @classmethod
     def getPalette(self, color_palette, palette_size, custom_colors):
-        if color_palette == "CUSTOM":
-            return sv.ColorPalette(
-                colors=[str_to_color(color) for color in custom_colors]
-            )
-        elif hasattr(sv.ColorPalette, color_palette):
-            return getattr(sv.ColorPalette, color_palette)
-        else:
-            palette_name = color_palette.replace("Matplotlib ", "")
-
-            if palette_name in [
-                "Greys_R",
-                "Purples_R",
-                "Blues_R",
-                "Greens_R",
-                "Oranges_R",
-                "Reds_R",
-                "Wistia",
-                "Pastel1",
-                "Pastel2",
-                "Paired",
-                "Accent",
-                "Dark2",
-                "Set1",
-                "Set2",
-                "Set3",
-            ]:
-                palette_name = palette_name.capitalize()
-            else:
-                palette_name = palette_name.lower()
-
-            return sv.ColorPalette.from_matplotlib(palette_name, int(palette_size))
+        return _get_palette(
+            color_palette=color_palette,
+            palette_size=palette_size,
+            custom_colors=tuple(custom_colors or ()),
+        )
 
     @abstractmethod
     def run(
@@ -160,3 +135,40 @@ class ColorableVisualizationBlock(PredictionsVisualizationBlock, ABC):
         **kwargs
     ) -> BlockResult:
         pass
+
+
+@lru_cache(maxsize=64)
+def _get_palette(
+    color_palette: str,
+    palette_size: int,
+    custom_colors: Tuple[str, ...],
+) -> sv.ColorPalette:
+    if color_palette == "CUSTOM":
+        return sv.ColorPalette(colors=[str_to_color(color) for color in custom_colors])
+    elif hasattr(sv.ColorPalette, color_palette):
+        return getattr(sv.ColorPalette, color_palette)
+    else:
+        palette_name = color_palette.replace("Matplotlib ", "")
+
+        if palette_name in [
+            "Greys_R",
+            "Purples_R",
+            "Blues_R",
+            "Greens_R",
+            "Oranges_R",
+            "Reds_R",
+            "Wistia",
+            "Pastel1",
+            "Pastel2",
+            "Paired",
+            "Accent",
+            "Dark2",
+            "Set1",
+            "Set2",
+            "Set3",
+        ]:
+            palette_name = palette_name.capitalize()
+        else:
+            palette_name = palette_name.lower()
+
+        return sv.ColorPalette.from_matplotlib(palette_name, int(palette_size))
@@ -1,8 +1,13 @@
-from typing import List, Literal, Optional, Type, Union
+from functools import partial
+from typing import Callable, List, Literal, Optional, Type, Union
 
+import numpy as np
 import supervision as sv
 from pydantic import ConfigDict, Field
 
+from inference.core.workflows.core_steps.visualizations.common.annotators.mask import (
+    MaskAnnotator,
+)
 from inference.core.workflows.core_steps.visualizations.common.base import (
     OUTPUT_IMAGE_KEY,
 )
@@ -66,6 +71,7 @@ class MaskVisualizationBlockV1(ColorableVisualizationBlock):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.annotatorCache = {}
+        self.annotateFunctionCache = {}
 
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
@@ -78,23 +84,19 @@ class MaskVisualizationBlockV1(ColorableVisualizationBlock):
         custom_colors: List[str],
         color_axis: str,
         opacity: float,
-    ) -> sv.annotators.base.BaseAnnotator:
-        key = "_".join(
-            map(
-                str,
-                [
-                    color_palette,
-                    palette_size,
-                    color_axis,
-                    opacity,
-                ],
-            )
+    ) -> MaskAnnotator:
+        key = (
+            color_palette,
+            palette_size,
+            tuple(custom_colors or ()),
+            color_axis,
+            opacity,
         )
 
         if key not in self.annotatorCache:
             palette = self.getPalette(color_palette, palette_size, custom_colors)
 
-            self.annotatorCache[key] = sv.MaskAnnotator(
+            self.annotatorCache[key] = MaskAnnotator(
                 color=palette,
                 color_lookup=getattr(sv.ColorLookup, color_axis),
                 opacity=opacity,
@@ -102,6 +104,40 @@ class MaskVisualizationBlockV1(ColorableVisualizationBlock):
 
         return self.annotatorCache[key]
 
+    def getAnnotateFunction(
+        self,
+        color_palette: str,
+        palette_size: int,
+        custom_colors: List[str],
+        color_axis: str,
+        opacity: float,
+        copy_image: bool,
+    ) -> Callable[[np.ndarray, sv.Detections], np.ndarray]:
+        key = (
+            color_palette,
+            palette_size,
+            tuple(custom_colors or ()),
+            color_axis,
+            opacity,
+            copy_image,
+        )
+
+        if key not in self.annotateFunctionCache:
+            annotator = self.getAnnotator(
+                color_palette,
+                palette_size,
+                custom_colors,
+                color_axis,
+                opacity,
+            )
+            # configuration is constant across frames of a stream, so it is bound
+            # once here rather than being dispatched on every run
+            self.annotateFunctionCache[key] = partial(
+                annotator.annotate, copy_scene=copy_image
+            )
+
+        return self.annotateFunctionCache[key]
+
     def run(
         self,
         image: WorkflowImageData,
@@ -113,18 +149,16 @@ class MaskVisualizationBlockV1(ColorableVisualizationBlock):
         color_axis: Optional[str],
         opacity: Optional[float],
     ) -> BlockResult:
-        annotator = self.getAnnotator(
+        annotate = self.getAnnotateFunction(
             color_palette,
             palette_size,
             custom_colors,
             color_axis,
             opacity,
+            copy_image,
         )
 
-        annotated_image = annotator.annotate(
-            scene=image.numpy_image.copy() if copy_image else image.numpy_image,
-            detections=predictions,
-        )
+        annotated_image = annotate(image.numpy_image, predictions)
         return {
             OUTPUT_IMAGE_KEY: WorkflowImageData.copy_and_replace(
                 origin_image_data=image, numpy_image=annotated_image
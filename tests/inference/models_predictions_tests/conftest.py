@@ -2,7 +2,7 @@ import json
 import os.path
 import shutil
 import zipfile
-from typing import Dict, Generator
+from typing import TYPE_CHECKING, Dict, Generator
 
 import cv2
 import numpy as np
@@ -11,6 +11,9 @@ import requests
 
 from inference.core.env import MODEL_CACHE_DIR
 
+if TYPE_CHECKING:
+    from inference.models.owlv2.owlv2 import OwlV2
+
 ASSETS_DIR = os.path.abspath(
     os.path.join(
         os.path.dirname(__file__),
@@ -26,6 +29,8 @@ SAM2_TRUCK_MASK_FROM_CACHE = os.path.join(ASSETS_DIR, "mask_from_cached_logits.n
 SAM2_MULTI_POLY_RESPONSE_PATH = os.path.join(
     ASSETS_DIR, "sam2_multipolygon_response.json"
 )
+SEAWITHDOCK_IMAGE_URL = "https://media.roboflow.com/inference/seawithdock.jpeg"
+DOCK2_IMAGE_URL = "https://media.roboflow.com/inference/dock2.jpg"
 
 
 @pytest.fixture(scope="function")
@@ -218,6 +223,25 @@ def sam2_small_truck_mask_from_cached_logits() -> Generator[np.ndarray, None, No
     yield np.load(SAM2_TRUCK_MASK_FROM_CACHE)
 
 
+@pytest.fixture(scope="session")
+def seawithdock_image_bytes() -> bytes:
+    return download_bytes(url=SEAWITHDOCK_IMAGE_URL)
+
+
+@pytest.fixture(scope="session")
+def dock2_image_bytes() -> bytes:
+    return download_bytes(url=DOCK2_IMAGE_URL)
+
+
+@pytest.fixture(scope="module")
+def owlv2_model() -> "OwlV2":
+    # imported here, so that other models tests are not paying for torch and
+    # transformers imports at collection time
+    from inference.models.owlv2.owlv2 import OwlV2
+
+    return OwlV2()
+
+
 def fetch_and_place_model_in_cache(
     model_id: str,
     model_package_url: str,
@@ -244,6 +268,12 @@ def download_file(
                 file.write(chunk)
 
 
+def download_bytes(url: str) -> bytes:
+    response = requests.get(url)
+    response.raise_for_status()
+    return response.content
+
+
 def extract_zip_package(zip_path: str, target_dir: str) -> None:
     os.makedirs(target_dir, exist_ok=True)
     with zipfile.ZipFile(zip_path, "r") as zip_ref:
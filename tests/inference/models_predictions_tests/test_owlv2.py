@@ -1,41 +1,85 @@
+import base64
+from typing import Any, Dict, List, Optional
+
 import pytest
 
 from inference.core.entities.requests.owlv2 import OwlV2InferenceRequest
 from inference.models.owlv2.owlv2 import OwlV2
 
 
-@pytest.mark.slow
-def test_owlv2():
-    image = {
-        "type": "url",
-        "value": "https://media.roboflow.com/inference/seawithdock.jpeg",
-    }
+def to_base64_image(image_bytes: bytes) -> dict:
+    return {"type": "base64", "value": base64.b64encode(image_bytes).decode("ascii")}
+
+
+POST_BOX = {"x": 223, "y": 306, "w": 40, "h": 226, "cls": "post", "negative": False}
+NEGATIVE_POST_BOX = {
+    "x": 247,
+    "y": 294,
+    "w": 25,
+    "h": 165,
+    "cls": "post",
+    "negative": True,
+}
+SECOND_POST_BOX = {
+    "x": 264,
+    "y": 327,
+    "w": 21,
+    "h": 74,
+    "cls": "post",
+    "negative": False,
+}
+BAD_BOX = {"x": 1, "y": 1, "w": 1, "h": 1, "cls": "post", "negative": False}
+
+PROMPTED_REQUEST_PARAMETERS = {"visualize_predictions": True, "confidence": 0.9}
+
+# each case defines boxes for subsequent training images (all being the inferred image),
+# additional request parameters, expected x coordinates of sorted posts (if to be verified)
+# and expected number of predictions
+OWLV2_PROMPTS_CASES = [
+    # single positive prompt - we're finding all of the posts in the image
+    ([[POST_BOX]], PROMPTED_REQUEST_PARAMETERS, [223, 248, 264, 532, 572], 5),
+    # multiple (positive and negative) prompts for the same image
+    (
+        [[POST_BOX, NEGATIVE_POST_BOX, SECOND_POST_BOX]],
+        PROMPTED_REQUEST_PARAMETERS,
+        [223, 264, 532, 572],
+        4,
+    ),
+    # training image without any prompts
+    ([[POST_BOX], []], PROMPTED_REQUEST_PARAMETERS, None, 5),
+    # bad prompt
+    ([[BAD_BOX]], PROMPTED_REQUEST_PARAMETERS, None, 0),
+    # bad prompt hidden among good prompts
+    ([[BAD_BOX, POST_BOX]], PROMPTED_REQUEST_PARAMETERS, None, 5),
+    # no training data - with default request parameters
+    ([], {}, None, 0),
+]
+
 
-    # test we can handle a single positive prompt
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "training_boxes, request_parameters, expected_xs, expected_count",
+    OWLV2_PROMPTS_CASES,
+)
+def test_owlv2_prompts(
+    owlv2_model: OwlV2,
+    seawithdock_image_bytes: bytes,
+    training_boxes: List[List[dict]],
+    request_parameters: Dict[str, Any],
+    expected_xs: Optional[List[int]],
+    expected_count: int,
+) -> None:
+    image = to_base64_image(seawithdock_image_bytes)
     request = OwlV2InferenceRequest(
         image=image,
-        training_data=[
-            {
-                "image": image,
-                "boxes": [
-                    {
-                        "x": 223,
-                        "y": 306,
-                        "w": 40,
-                        "h": 226,
-                        "cls": "post",
-                        "negative": False,
-                    },
-                ],
-            }
-        ],
-        visualize_predictions=True,
-        confidence=0.9,
+        training_data=[{"image": image, "boxes": boxes} for boxes in training_boxes],
+        **request_parameters,
     )
 
-    response = OwlV2().infer_from_request(request)
-    # we assert that we're finding all of the posts in the image
-    assert len(response.predictions) == 5
+    response = owlv2_model.infer_from_request(request)
+    assert len(response.predictions) == expected_count
+    if expected_xs is None:
+        return None
     # next we check the x coordinates to force something about localization
     # the exact value here is sensitive to:
     # 1. the image interpolation mode used
@@ -46,206 +90,17 @@ def test_owlv2():
     # first we sort by x coordinate to make sure we're getting the correct post
     posts = [p for p in response.predictions if p.class_name == "post"]
     posts.sort(key=lambda x: x.x)
-    assert abs(223 - posts[0].x) < 1.5
-    assert abs(248 - posts[1].x) < 1.5
-    assert abs(264 - posts[2].x) < 1.5
-    assert abs(532 - posts[3].x) < 1.5
-    assert abs(572 - posts[4].x) < 1.5
+    assert len(posts) == len(expected_xs)
+    for expected_x, post in zip(expected_xs, posts):
+        assert abs(expected_x - post.x) < 1.5
 
 
 @pytest.mark.slow
-def test_owlv2_multiple_prompts():
-    image = {
-        "type": "url",
-        "value": "https://media.roboflow.com/inference/seawithdock.jpeg",
-    }
-
-    # test we can handle multiple (positive and negative) prompts for the same image
-    request = OwlV2InferenceRequest(
-        image=image,
-        training_data=[
-            {
-                "image": image,
-                "boxes": [
-                    {
-                        "x": 223,
-                        "y": 306,
-                        "w": 40,
-                        "h": 226,
-                        "cls": "post",
-                        "negative": False,
-                    },
-                    {
-                        "x": 247,
-                        "y": 294,
-                        "w": 25,
-                        "h": 165,
-                        "cls": "post",
-                        "negative": True,
-                    },
-                    {
-                        "x": 264,
-                        "y": 327,
-                        "w": 21,
-                        "h": 74,
-                        "cls": "post",
-                        "negative": False,
-                    },
-                ],
-            }
-        ],
-        visualize_predictions=True,
-        confidence=0.9,
-    )
-
-    response = OwlV2().infer_from_request(request)
-    assert len(response.predictions) == 4
-    posts = [p for p in response.predictions if p.class_name == "post"]
-    posts.sort(key=lambda x: x.x)
-    assert abs(223 - posts[0].x) < 1.5
-    assert abs(264 - posts[1].x) < 1.5
-    assert abs(532 - posts[2].x) < 1.5
-    assert abs(572 - posts[3].x) < 1.5
-
-
-@pytest.mark.slow
-def test_owlv2_image_without_prompts():
-    image = {
-        "type": "url",
-        "value": "https://media.roboflow.com/inference/seawithdock.jpeg",
-    }
-
-    # test that we can handle an image without any prompts
-    request = OwlV2InferenceRequest(
-        image=image,
-        training_data=[
-            {
-                "image": image,
-                "boxes": [
-                    {
-                        "x": 223,
-                        "y": 306,
-                        "w": 40,
-                        "h": 226,
-                        "cls": "post",
-                        "negative": False,
-                    }
-                ],
-            },
-            {
-                "image": image,
-                "boxes": [],
-            },
-        ],
-        visualize_predictions=True,
-        confidence=0.9,
-    )
-
-    response = OwlV2().infer_from_request(request)
-    assert len(response.predictions) == 5
-
-
-@pytest.mark.slow
-def test_owlv2_bad_prompt():
-    image = {
-        "type": "url",
-        "value": "https://media.roboflow.com/inference/seawithdock.jpeg",
-    }
-
-    # test that we can handle a bad prompt
-    request = OwlV2InferenceRequest(
-        image=image,
-        training_data=[
-            {
-                "image": image,
-                "boxes": [
-                    {
-                        "x": 1,
-                        "y": 1,
-                        "w": 1,
-                        "h": 1,
-                        "cls": "post",
-                        "negative": False,
-                    }
-                ],
-            }
-        ],
-        visualize_predictions=True,
-        confidence=0.9,
-    )
-
-    response = OwlV2().infer_from_request(request)
-    assert len(response.predictions) == 0
-
-
-@pytest.mark.slow
-def test_owlv2_bad_prompt_hidden_among_good_prompts():
-    image = {
-        "type": "url",
-        "value": "https://media.roboflow.com/inference/seawithdock.jpeg",
-    }
-
-    # test that we can handle a bad prompt
-    request = OwlV2InferenceRequest(
-        image=image,
-        training_data=[
-            {
-                "image": image,
-                "boxes": [
-                    {
-                        "x": 1,
-                        "y": 1,
-                        "w": 1,
-                        "h": 1,
-                        "cls": "post",
-                        "negative": False,
-                    },
-                    {
-                        "x": 223,
-                        "y": 306,
-                        "w": 40,
-                        "h": 226,
-                        "cls": "post",
-                        "negative": False,
-                    },
-                ],
-            }
-        ],
-        visualize_predictions=True,
-        confidence=0.9,
-    )
-
-    response = OwlV2().infer_from_request(request)
-    assert len(response.predictions) == 5
-
-
-@pytest.mark.slow
-def test_owlv2_no_training_data():
-    image = {
-        "type": "url",
-        "value": "https://media.roboflow.com/inference/seawithdock.jpeg",
-    }
-
-    # test that we can handle no training data
-    request = OwlV2InferenceRequest(
-        image=image,
-        training_data=[],
-    )
-
-    response = OwlV2().infer_from_request(request)
-    assert len(response.predictions) == 0
-
-
-@pytest.mark.slow
-def test_owlv2_multiple_training_images():
-    image = {
-        "type": "url",
-        "value": "https://media.roboflow.com/inference/seawithdock.jpeg",
-    }
-    second_image = {
-        "type": "url",
-        "value": "https://media.roboflow.com/inference/dock2.jpg",
-    }
+def test_owlv2_multiple_training_images(
+    owlv2_model: OwlV2, seawithdock_image_bytes: bytes, dock2_image_bytes: bytes
+) -> None:
+    image = to_base64_image(seawithdock_image_bytes)
+    second_image = to_base64_image(dock2_image_bytes)
 
     request = OwlV2InferenceRequest(
         image=image,
@@ -281,20 +136,16 @@ def test_owlv2_multiple_training_images():
         confidence=0.9,
     )
 
-    response = OwlV2().infer_from_request(request)
+    response = owlv2_model.infer_from_request(request)
     assert len(response.predictions) == 5
 
 
 @pytest.mark.slow
-def test_owlv2_multiple_training_images_repeated_inference():
-    image = {
-        "type": "url",
-        "value": "https://media.roboflow.com/inference/seawithdock.jpeg",
-    }
-    second_image = {
-        "type": "url",
-        "value": "https://media.roboflow.com/inference/dock2.jpg",
-    }
+def test_owlv2_multiple_training_images_repeated_inference(
+    owlv2_model: OwlV2, seawithdock_image_bytes: bytes, dock2_image_bytes: bytes
+) -> None:
+    image = to_base64_image(seawithdock_image_bytes)
+    second_image = to_base64_image(dock2_image_bytes)
 
     request = OwlV2InferenceRequest(
         image=image,
@@ -330,9 +181,9 @@ def test_owlv2_multiple_training_images_repeated_inference():
         confidence=0.9,
     )
 
-    model = OwlV2()
-    first_response = model.infer_from_request(request)
-    second_response = model.infer_from_request(request)
+    owlv2_model.reset_cache()
+    first_response = owlv2_model.infer_from_request(request)
+    second_response = owlv2_model.infer_from_request(request)
     for p1, p2 in zip(first_response.predictions, second_response.predictions):
         assert p1.class_name == p2.class_name
         assert p1.x == p2.x
@@ -340,7 +191,3 @@ def test_owlv2_multiple_training_images_repeated_inference():
         assert p1.width == p2.width
         assert p1.height == p2.height
         assert p1.confidence == p2.confidence
-
-
-if __name__ == "__main__":
-    test_owlv2()
@@ -0,0 +1,123 @@
+import orjson
+
+from inference.core.interfaces.http.handlers import workflows
+from inference.core.interfaces.http.handlers.workflows import (
+    handle_describe_workflows_blocks_request,
+    handle_describe_workflows_blocks_request_raw,
+)
+from inference.core.workflows.execution_engine.v1.dynamic_blocks.entities import (
+    DynamicBlockDefinition,
+)
+
+PYTHON_CODE = """
+def run(self, value):
+    return {"output": value}
+"""
+
+
+def _build_dynamic_blocks_definitions() -> list:
+    return [
+        DynamicBlockDefinition.model_validate(
+            {
+                "type": "DynamicBlockDefinition",
+                "manifest": {
+                    "type": "ManifestDescription",
+                    "block_type": "MyIdentityBlock",
+                    "inputs": {
+                        "value": {
+                            "type": "DynamicInputDefinition",
+                            "selector_types": ["input_parameter"],
+                        },
+                    },
+                    "outputs": {
+                        "output": {"type": "DynamicOutputDefinition"},
+                    },
+                },
+                "code": {
+                    "type": "PythonCode",
+                    "run_function_code": PYTHON_CODE,
+                },
+            }
+        )
+    ]
+
+
+def test_handle_describe_workflows_blocks_request_when_no_dynamic_blocks_given() -> (
+    None
+):
+    # when
+    first_result = handle_describe_workflows_blocks_request()
+    second_result = handle_describe_workflows_blocks_request(
+        dynamic_blocks_definitions=[]
+    )
+
+    # then
+    assert len(first_result.blocks) > 0, "Expected core blocks to be described"
+    assert first_result.model_dump(mode="json") == second_result.model_dump(
+        mode="json"
+    ), "Expected descriptions to be equal"
+
+
+def test_handle_describe_workflows_blocks_request_raw() -> None:
+    # when
+    result = handle_describe_workflows_blocks_request_raw()
+
+    # then
+    expected_description = handle_describe_workflows_blocks_request()
+    assert result.media_type == "application/json"
+    assert orjson.loads(result.body) == expected_description.model_dump(
+        mode="json"
+    ), "Expected pre-serialised body to match serialised blocks description"
+
+
+def test_handle_describe_workflows_blocks_request_raw_when_equal_dynamic_blocks_given() -> (
+    None
+):
+    # given
+    workflows._serialise_dynamic_blocks_description.cache_clear()
+
+    # when
+    first_result = handle_describe_workflows_blocks_request_raw(
+        dynamic_blocks_definitions=_build_dynamic_blocks_definitions(),
+    )
+    second_result = handle_describe_workflows_blocks_request_raw(
+        dynamic_blocks_definitions=_build_dynamic_blocks_definitions(),
+    )
+
+    # then
+    cache_info = workflows._serialise_dynamic_blocks_description.cache_info()
+    assert (
+        cache_info.misses == 1 and cache_info.hits == 1
+    ), "Expected second request to hit cached description"
+    assert (
+        first_result.body is second_result.body
+    ), "Expected the same pre-serialised body to be served"
+    described_blocks = {
+        block["manifest_type_identifier"]
+        for block in orjson.loads(first_result.body)["blocks"]
+    }
+    assert (
+        "MyIdentityBlock" in described_blocks
+    ), "Expected dynamic block to be described"
+
+
+def test_handle_describe_workflows_blocks_request_raw_when_different_execution_engine_versions_requested() -> (
+    None
+):
+    # given
+    workflows._serialise_dynamic_blocks_description.cache_clear()
+
+    # when
+    _ = handle_describe_workflows_blocks_request_raw(
+        dynamic_blocks_definitions=_build_dynamic_blocks_definitions(),
+    )
+    _ = handle_describe_workflows_blocks_request_raw(
+        dynamic_blocks_definitions=_build_dynamic_blocks_definitions(),
+        requested_execution_engine_version="1.2.0",
+    )
+
+    # then
+    cache_info = workflows._serialise_dynamic_blocks_description.cache_info()
+    assert (
+        cache_info.misses == 2 and cache_info.hits == 0
+    ), "Expected description not to be shared between Execution Engine versions"
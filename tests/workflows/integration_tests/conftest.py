@@ -16,6 +16,10 @@ def roboflow_api_key() -> str:
 
 @pytest.fixture(scope="function")
 def model_manager() -> ModelManager:
+    return build_model_manager()
+
+
+def build_model_manager() -> ModelManager:
     model_registry = RoboflowModelRegistry(ROBOFLOW_MODEL_TYPES)
     model_manager = ModelManager(model_registry=model_registry)
     return WithFixedSizeCache(model_manager, max_size=MAX_ACTIVE_MODELS)
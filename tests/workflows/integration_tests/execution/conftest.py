@@ -22,6 +22,10 @@ def license_plate_image() -> np.ndarray:
 
 @pytest.fixture(scope="function")
 def dogs_image() -> np.ndarray:
+    return load_dogs_image()
+
+
+def load_dogs_image() -> np.ndarray:
     return cv2.imread(os.path.join(ASSETS_DIR, "dogs.jpg"))
 
 
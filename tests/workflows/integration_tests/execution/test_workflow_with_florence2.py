@@ -1,8 +1,8 @@
-import copy
-import json
 import os
+from typing import Any, Dict, Generator, Tuple
 
 import numpy as np
+import orjson
 import pytest
 
 from inference.core.env import WORKFLOWS_MAX_CONCURRENT_STEPS
@@ -10,11 +10,65 @@ from inference.core.managers.base import ModelManager
 from inference.core.workflows.core_steps.common.entities import StepExecutionMode
 from inference.core.workflows.execution_engine.core import ExecutionEngine
 from inference.core.workflows.execution_engine.entities.base import WorkflowImageData
-from tests.workflows.integration_tests.execution.conftest import bool_env
+from tests.workflows.integration_tests.conftest import build_model_manager
+from tests.workflows.integration_tests.execution.conftest import (
+    bool_env,
+    load_dogs_image,
+)
 from tests.workflows.integration_tests.execution.workflows_gallery_collector.decorators import (
     add_to_workflows_gallery,
 )
 
+
+# fixtures below override function-scoped ones from conftest, such that Florence 2
+# and auxiliary models are loaded and the input image is decoded once for all tests
+@pytest.fixture(scope="module")
+def model_manager() -> ModelManager:
+    return build_model_manager()
+
+
+@pytest.fixture(scope="module")
+def dogs_image() -> np.ndarray:
+    return load_dogs_image()
+
+
+# Execution Engine holds no state regarding runs, so engines compiled for the same
+# definition are safe to be shared among tests - cache is bound to `model_manager`,
+# such that engines are released together with models they hold references to
+@pytest.fixture(scope="module")
+def execution_engines(
+    model_manager: ModelManager,
+) -> Generator[Dict[Tuple[bytes, bytes], ExecutionEngine], None, None]:
+    execution_engines = {}
+    yield execution_engines
+    execution_engines.clear()
+
+
+def get_execution_engine(
+    execution_engines: Dict[Tuple[bytes, bytes], ExecutionEngine],
+    workflow_definition: dict,
+    init_parameters: Dict[str, Any],
+) -> ExecutionEngine:
+    # model manager is bound to the cache itself, remaining parameters (like API key
+    # or step execution mode) must match the ones engine was built with
+    parameters = {
+        name: value
+        for name, value in init_parameters.items()
+        if name != "workflows_core.model_manager"
+    }
+    key = (
+        orjson.dumps(workflow_definition),
+        orjson.dumps(parameters, option=orjson.OPT_SORT_KEYS),
+    )
+    if key not in execution_engines:
+        execution_engines[key] = ExecutionEngine.init(
+            workflow_definition=workflow_definition,
+            init_parameters=init_parameters,
+            max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
+        )
+    return execution_engines[key]
+
+
 FLORENCE2_GROUNDED_CLASSIFICATION_WORKFLOW_DEFINITION = {
     "version": "1.0",
     "inputs": [
@@ -72,6 +126,7 @@ will select one based on parameter.
 )
 def test_florence2_grounded_classification(
     model_manager: ModelManager,
+    execution_engines: Dict[Tuple[bytes, bytes], ExecutionEngine],
     dogs_image: np.ndarray,
     roboflow_api_key: str,
 ) -> None:
@@ -81,10 +136,10 @@ def test_florence2_grounded_classification(
         "workflows_core.api_key": roboflow_api_key,
         "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
     }
-    execution_engine = ExecutionEngine.init(
+    execution_engine = get_execution_engine(
+        execution_engines=execution_engines,
         workflow_definition=FLORENCE2_GROUNDED_CLASSIFICATION_WORKFLOW_DEFINITION,
         init_parameters=workflow_init_parameters,
-        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
     )
 
     # when
@@ -100,7 +155,7 @@ def test_florence2_grounded_classification(
         "model_predictions",
     }, "Expected all declared outputs to be delivered"
 
-    assert json.loads(result[0]["model_predictions"]["raw_output"]).startswith(
+    assert orjson.loads(result[0]["model_predictions"]["raw_output"]).startswith(
         "dog"
     ), "Expected dog to be output by florence2"
 
@@ -110,6 +165,7 @@ def test_florence2_grounded_classification(
 )
 def test_florence2_grounded_classification_when_no_grounding_available(
     model_manager: ModelManager,
+    execution_engines: Dict[Tuple[bytes, bytes], ExecutionEngine],
     dogs_image: np.ndarray,
     roboflow_api_key: str,
 ) -> None:
@@ -119,10 +175,10 @@ def test_florence2_grounded_classification_when_no_grounding_available(
         "workflows_core.api_key": roboflow_api_key,
         "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
     }
-    execution_engine = ExecutionEngine.init(
+    execution_engine = get_execution_engine(
+        execution_engines=execution_engines,
         workflow_definition=FLORENCE2_GROUNDED_CLASSIFICATION_WORKFLOW_DEFINITION,
         init_parameters=workflow_init_parameters,
-        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
     )
 
     # when
@@ -197,6 +253,7 @@ will select one based on parameter.
 )
 def test_florence2_grounded_instance_segmentation(
     model_manager: ModelManager,
+    execution_engines: Dict[Tuple[bytes, bytes], ExecutionEngine],
     dogs_image: np.ndarray,
     roboflow_api_key: str,
 ) -> None:
@@ -206,10 +263,10 @@ def test_florence2_grounded_instance_segmentation(
         "workflows_core.api_key": roboflow_api_key,
         "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
     }
-    execution_engine = ExecutionEngine.init(
+    execution_engine = get_execution_engine(
+        execution_engines=execution_engines,
         workflow_definition=FLORENCE2_GROUNDED_INSTANCE_SEGMENTATION_WORKFLOW_DEFINITION,
         init_parameters=workflow_init_parameters,
-        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
     )
 
     # when
@@ -260,6 +317,7 @@ FLORENCE2_GROUNDED_INSTANCE_SEGMENTATION_GROUNDED_BY_INPUT_WORKFLOW_DEFINITION =
 )
 def test_florence2_instance_segmentation_grounded_by_input(
     model_manager: ModelManager,
+    execution_engines: Dict[Tuple[bytes, bytes], ExecutionEngine],
     dogs_image: np.ndarray,
     roboflow_api_key: str,
 ) -> None:
@@ -269,10 +327,10 @@ def test_florence2_instance_segmentation_grounded_by_input(
         "workflows_core.api_key": roboflow_api_key,
         "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
     }
-    execution_engine = ExecutionEngine.init(
+    execution_engine = get_execution_engine(
+        execution_engines=execution_engines,
         workflow_definition=FLORENCE2_GROUNDED_INSTANCE_SEGMENTATION_WORKFLOW_DEFINITION,
         init_parameters=workflow_init_parameters,
-        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
     )
 
     # when
@@ -347,6 +405,7 @@ will select one based on parameter.
 )
 def test_florence2_grounded_caption(
     model_manager: ModelManager,
+    execution_engines: Dict[Tuple[bytes, bytes], ExecutionEngine],
     dogs_image: np.ndarray,
     roboflow_api_key: str,
 ) -> None:
@@ -356,10 +415,10 @@ def test_florence2_grounded_caption(
         "workflows_core.api_key": roboflow_api_key,
         "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
     }
-    execution_engine = ExecutionEngine.init(
+    execution_engine = get_execution_engine(
+        execution_engines=execution_engines,
         workflow_definition=FLORENCE2_GROUNDED_CAPTION_WORKFLOW_DEFINITION,
         init_parameters=workflow_init_parameters,
-        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
     )
 
     # when
@@ -375,7 +434,7 @@ def test_florence2_grounded_caption(
         "model_predictions",
     }, "Expected all declared outputs to be delivered"
 
-    assert json.loads(result[0]["model_predictions"]["raw_output"]).startswith(
+    assert orjson.loads(result[0]["model_predictions"]["raw_output"]).startswith(
         "dog"
     ), "Expected dog to be output by florence2"
 
@@ -448,6 +507,7 @@ providing not meaningful labels for all of the objects you specified in class li
 )
 def test_florence2_object_detection(
     model_manager: ModelManager,
+    execution_engines: Dict[Tuple[bytes, bytes], ExecutionEngine],
     dogs_image: np.ndarray,
     roboflow_api_key: str,
 ) -> None:
@@ -457,10 +517,10 @@ def test_florence2_object_detection(
         "workflows_core.api_key": roboflow_api_key,
         "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
     }
-    execution_engine = ExecutionEngine.init(
+    execution_engine = get_execution_engine(
+        execution_engines=execution_engines,
         workflow_definition=FLORENCE_OBJECT_DETECTION_WORKFLOW,
         init_parameters=workflow_init_parameters,
-        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
     )
 
     # when
@@ -539,9 +599,15 @@ FLORENCE_VLM_AS_DET_VISUALIZE_DEF = {
     ],
 }
 
+# definition holds only JSON-serialisable values, so copies can be made by
+# decoding its serialised form, which is a lot faster than copy.deepcopy(...)
+_FLORENCE_VLM_AS_DET_VISUALIZE_DEF_JSON = orjson.dumps(
+    FLORENCE_VLM_AS_DET_VISUALIZE_DEF
+)
+
 
 def make_visualize_workflow(task_type):
-    wf_def = copy.deepcopy(FLORENCE_VLM_AS_DET_VISUALIZE_DEF)
+    wf_def = orjson.loads(_FLORENCE_VLM_AS_DET_VISUALIZE_DEF_JSON)
     if task_type == "phrase-grounded-object-detection":
         wf_def["steps"][0]["prompt"] = "dog"
     elif task_type == "open-vocabulary-object-detection":
@@ -558,6 +624,7 @@ def make_visualize_workflow(task_type):
 def test_florence_visualization_with_vlm_as_detector_all_variations(
     task_type,
     model_manager: ModelManager,
+    execution_engines: Dict[Tuple[bytes, bytes], ExecutionEngine],
     dogs_image: np.ndarray,
     roboflow_api_key: str,
 ) -> None:
@@ -567,10 +634,10 @@ def test_florence_visualization_with_vlm_as_detector_all_variations(
         "workflows_core.api_key": roboflow_api_key,
         "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
     }
-    execution_engine = ExecutionEngine.init(
+    execution_engine = get_execution_engine(
+        execution_engines=execution_engines,
         workflow_definition=make_visualize_workflow(task_type),
         init_parameters=workflow_init_parameters,
-        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
     )
 
     # when
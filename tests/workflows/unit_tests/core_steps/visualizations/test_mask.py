@@ -3,6 +3,16 @@ import pytest
 import supervision as sv
 from pydantic import ValidationError
 
+from inference.core.workflows.core_steps.visualizations.common.annotators._mask_kernel import (
+    NUMBA_AVAILABLE,
+    _find_masks_boxes,
+    _paint_masks_rows,
+    paint_masks,
+    warm_up_paint_masks_kernels,
+)
+from inference.core.workflows.core_steps.visualizations.common.annotators.jit import (
+    warm_up_jit_kernels,
+)
 from inference.core.workflows.core_steps.visualizations.mask.v1 import (
     MaskManifest,
     MaskVisualizationBlockV1,
@@ -97,3 +107,212 @@ def test_mask_visualization_block() -> None:
     assert not np.array_equal(
         output.get("image").numpy_image, np.zeros((1000, 1000, 3), dtype=np.uint8)
     )
+
+
+@pytest.mark.parametrize("copy_image", [True, False])
+def test_mask_visualization_block_respects_copy_image(copy_image: bool) -> None:
+    # given
+    block = MaskVisualizationBlockV1()
+    input_image = np.zeros((100, 100, 3), dtype=np.uint8)
+    mask = np.zeros((1, 100, 100), dtype=np.bool_)
+    mask[0, 10:20, 10:20] = True
+
+    # when
+    output = block.run(
+        image=WorkflowImageData(
+            parent_metadata=ImageParentMetadata(parent_id="some"),
+            numpy_image=input_image,
+        ),
+        predictions=sv.Detections(
+            xyxy=np.array([[10, 10, 20, 20]], dtype=np.float64),
+            mask=mask,
+            class_id=np.array([1]),
+        ),
+        copy_image=copy_image,
+        color_palette="DEFAULT",
+        palette_size=10,
+        custom_colors=[],
+        color_axis="CLASS",
+        opacity=0.5,
+    )
+
+    # then
+    annotated_image = output["image"].numpy_image
+    assert np.any(annotated_image[10:20, 10:20] > 0), "Expected mask to be painted"
+    assert np.all(annotated_image[20:, 20:] == 0), "Expected background untouched"
+    assert (
+        np.shares_memory(annotated_image, input_image) is not copy_image
+    ), "Expected input image to be annotated in place only when copy is not requested"
+    assert (
+        bool(np.all(input_image == 0)) is copy_image
+    ), "Expected input image to be left intact only when copy is requested"
+
+
+@pytest.mark.parametrize("copy_image", [True, False])
+@pytest.mark.parametrize("color_axis", ["INDEX", "CLASS", "TRACK"])
+def test_mask_visualization_block_matches_supervision_annotator(
+    copy_image: bool, color_axis: str
+) -> None:
+    # given
+    block = MaskVisualizationBlockV1()
+    input_image = np.random.randint(0, 256, (200, 300, 3), dtype=np.uint8)
+    expected_image = input_image.copy()
+    mask = np.zeros((3, 200, 300), dtype=np.bool_)
+    mask[0, 0:150, 0:200] = True
+    mask[1, 50:100, 50:250] = True
+    mask[2, 120:200, 180:300] = True
+    detections = sv.Detections(
+        xyxy=np.array(
+            [[0, 0, 200, 150], [50, 50, 250, 100], [180, 120, 300, 200]],
+            dtype=np.float64,
+        ),
+        mask=mask,
+        class_id=np.array([0, 1, 27]),
+        tracker_id=np.array([12, 3, 5]),
+    )
+    expected_image = sv.MaskAnnotator(
+        color=sv.ColorPalette.DEFAULT,
+        color_lookup=getattr(sv.ColorLookup, color_axis),
+        opacity=0.6,
+    ).annotate(scene=expected_image, detections=detections)
+
+    # when
+    output = block.run(
+        image=WorkflowImageData(
+            parent_metadata=ImageParentMetadata(parent_id="some"),
+            numpy_image=input_image,
+        ),
+        predictions=detections,
+        copy_image=copy_image,
+        color_palette="DEFAULT",
+        palette_size=10,
+        custom_colors=[],
+        color_axis=color_axis,
+        opacity=0.6,
+    )
+
+    # then
+    assert np.array_equal(
+        output["image"].numpy_image, expected_image
+    ), "Expected output to be the same as produced by sv.MaskAnnotator"
+
+
+def test_mask_visualization_block_when_custom_colors_change_between_runs() -> None:
+    # given
+    block = MaskVisualizationBlockV1()
+    mask = np.zeros((1, 100, 100), dtype=np.bool_)
+    mask[0, 10:20, 10:20] = True
+    detections = sv.Detections(
+        xyxy=np.array([[10, 10, 20, 20]], dtype=np.float64),
+        mask=mask,
+        class_id=np.array([0]),
+    )
+
+    # when
+    results = [
+        block.run(
+            image=WorkflowImageData(
+                parent_metadata=ImageParentMetadata(parent_id="some"),
+                numpy_image=np.zeros((100, 100, 3), dtype=np.uint8),
+            ),
+            predictions=detections,
+            copy_image=True,
+            color_palette="CUSTOM",
+            palette_size=10,
+            custom_colors=custom_colors,
+            color_axis="CLASS",
+            opacity=1.0,
+        )
+        for custom_colors in (["#FF0000"], ["#0000FF"])
+    ]
+
+    # then
+    first_color = results[0]["image"].numpy_image[15, 15].tolist()
+    second_color = results[1]["image"].numpy_image[15, 15].tolist()
+    assert first_color == [0, 0, 255], "Expected mask painted red (BGR) in first run"
+    assert second_color == [
+        255,
+        0,
+        0,
+    ], "Expected mask painted blue (BGR) in second run, not reusing first palette"
+
+
+def _prepare_masks_painting_inputs() -> tuple:
+    masks = np.zeros((4, 40, 60), dtype=np.bool_)
+    masks[0, 0:30, 0:40] = True
+    masks[1, 10:20, 10:50] = True
+    masks[2, 25:40, 35:60] = True
+    masks[2, 30:35, 40:45] = False
+    order = np.array([0, 2, 3, 1])
+    colors = np.array(
+        [[255, 0, 0], [0, 255, 0], [0, 0, 255], [255, 255, 255]], dtype=np.uint8
+    )
+    image = np.random.randint(0, 256, (40, 60, 3), dtype=np.uint8)
+    expected_image = image.copy()
+    for mask_idx in order:
+        expected_image[masks[mask_idx]] = colors[mask_idx]
+    return image, masks, order, colors, expected_image
+
+
+def test_mask_kernel_body_matches_numpy_masks_painting() -> None:
+    # given
+    image, masks, order, colors, expected_image = _prepare_masks_painting_inputs()
+
+    # when
+    boxes = _find_masks_boxes(masks=masks)
+    _paint_masks_rows(image, masks, order, colors, boxes)
+
+    # then
+    assert boxes.tolist() == [
+        [0, 30, 0, 40],
+        [10, 20, 10, 50],
+        [25, 40, 35, 60],
+        [0, 0, 0, 0],
+    ], "Expected boxes to be given as (top, bottom, left, right), empty for mask 3"
+    assert np.array_equal(
+        image, expected_image
+    ), "Expected JIT kernel body to paint the same image as boolean indexing"
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba is not installed")
+def test_compiled_mask_kernel_matches_numpy_masks_painting() -> None:
+    # given
+    image, masks, order, colors, expected_image = _prepare_masks_painting_inputs()
+    warm_up_paint_masks_kernels()
+
+    # when
+    # reversed view - just like the one given by np.flip(...) in MaskAnnotator
+    paint_masks(image=image, masks=masks, order=np.flip(order[::-1]), colors=colors)
+
+    # then
+    assert np.array_equal(
+        image, expected_image
+    ), "Expected compiled JIT kernel to paint the same image as boolean indexing"
+
+
+@pytest.mark.parametrize("warm_up", [False, True])
+def test_paint_masks_when_masks_are_not_boolean(warm_up: bool) -> None:
+    # given
+    image, masks, order, colors, expected_image = _prepare_masks_painting_inputs()
+    if warm_up:
+        warm_up_paint_masks_kernels()
+
+    # when
+    paint_masks(image=image, masks=masks.astype(np.uint8), order=order, colors=colors)
+
+    # then
+    assert np.array_equal(
+        image, expected_image
+    ), "Expected uint8 masks to be painted the same way as boolean ones"
+
+
+def test_warm_up_jit_kernels() -> None:
+    # when
+    warm_up_jit_kernels()
+
+    # then - no error, compiled kernel (if numba is installed) is usable
+    image, masks, order, colors, expected_image = _prepare_masks_painting_inputs()
+    paint_masks(image=image, masks=masks, order=order, colors=colors)
+    assert np.array_equal(
+        image, expected_image
+    ), "Expected masks painting to work after kernels warm-up"